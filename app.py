@@ -1,166 +1,482 @@
 import re
 import requests
-from flask import Flask, jsonify, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from flask import Flask, Response, request
 from bs4 import BeautifulSoup
+import collections
 import feedparser
+import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
-from functools import wraps
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 
 app = Flask(__name__)
 
-# Simple in-memory caching system
-cache_storage = {}
+# WARNING by default so production requests do no log formatting or I/O;
+# set LOG_LEVEL=DEBUG to get the verbose per-entry diagnostics back
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+log = logging.getLogger(__name__)
 
-def cache_with_timeout(timeout_minutes):
+def json_response(payload):
+    """Serialize a payload with orjson, which is much faster than the
+    stdlib encoder behind Flask's jsonify and emits bytes directly."""
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
+def etag_json_response(payload, max_age=300):
+    """
+    JSON response with a strong ETag so pollers that send If-None-Match
+    get a bodyless 304 when nothing changed. The volatile current_time
+    field is excluded from the tag, since it would defeat revalidation.
+    """
+    stable = {k: v for k, v in payload.items() if k != 'current_time'}
+    etag = hashlib.blake2b(orjson.dumps(stable), digest_size=8).hexdigest()
+    # Werkzeug handles the RFC 9110 quoting on both sides; comparing the
+    # raw header string would break behind any proxy that re-quotes it.
+    # If-None-Match uses weak comparison (RFC 9110 §13.1.2), so tags a
+    # gzipping proxy downgraded to W/"..." still revalidate
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = json_response(payload)
+        response.headers['Cache-Control'] = f'max-age={max_age}'
+    response.set_etag(etag)
+    return response
+
+# Precompiled regex patterns - compiling once at import time avoids the
+# per-call pattern-cache lookup inside the re module on the hot entry loop
+_AUTHOR_HREF_RE = re.compile(r'/author/')
+# Matches the author anchor directly in the raw description HTML, so the
+# common case needs no DOM construction at all
+_AUTHOR_A_RE = re.compile(r'<a[^>]*href="[^"]*/author/[^"]*"[^>]*>([^<]{2,100})</a>')
+_BY_AUTHOR_RE = re.compile(r' by ([^<\n]{1,100}?)(?:\s*<|$)')
+# "by Author" directly in the raw description HTML (capitalized name, so
+# stray lowercase "by" phrases inside review text don't match)
+_BY_TEXT_RE = re.compile(r'\bby\s+([A-Z][^<\n,]{1,80}?)(?:\s*<|\s*\(|$)')
+# Single alternation so one scan of the title covers both progress formats
+_PROGRESS_RE = re.compile(r'(?P<pct>\d+)%|page (?P<cur>\d+) of (?P<total>\d+)', re.IGNORECASE)
+# Activity classification as one alternation: a single C-level scan of the
+# lowercased title instead of five Python-level substring tests
+_PROGRESS_PHRASES_RE = re.compile(r'currently reading|is on page|% done|progress|done with')
+_USER_ID_RE = re.compile(r'/user/updates_rss/(\d+)')
+_QUOTED_RE = re.compile(r"'([^']+)'")
+_DONE_WITH_RE = re.compile(r"done with ([^\n]{1,300})$")
+_CHALLENGE_MODULE_ID_RE = re.compile(r'user_challenge_\d+')
+# One alternation instead of three sequential searches; branches are
+# ordered strictest first so the specific phrasings win at a given spot
+_CHALLENGE_LINK_RE = re.compile(
+    r'read (\d+) books? of your goal of (\d+)'
+    r'|read (\d+) of (\d+) books'
+    r'|(\d+) books? of (?:your goal of )?(\d+)',
+    re.IGNORECASE,
+)
+
+def _challenge_counts(match):
+    """Pull (books_read, books_goal) out of whichever branch matched."""
+    groups = match.groups()
+    for i in range(0, len(groups), 2):
+        if groups[i] is not None:
+            return (int(groups[i]), int(groups[i + 1]))
+    return None
+_CHALLENGE_MODULE_PATTERNS = [
+    re.compile(r'read (\d+) books? of your goal of (\d+)', re.IGNORECASE),
+    re.compile(r'(\d+) of (\d+) books', re.IGNORECASE),
+    re.compile(r'(\d+) books? [^\n]{0,200}?goal[^\n]{0,20}?(\d+)', re.IGNORECASE),
+]
+
+@lru_cache(maxsize=4)
+def _challenge_patterns_for_year(year):
+    """
+    Challenge patterns for the year-scoped profile modules, compiled
+    once per calendar year. Keyed on the year so they roll over
+    automatically each January instead of baking a year into a literal.
+    """
+    year_scoped = re.compile(rf'{year}[^\n]{{0,200}}?(\d+) of (\d+)', re.IGNORECASE)
+    return (year_scoped,) + tuple(_CHALLENGE_MODULE_PATTERNS)
+
+# Cap how much text the extraction regexes ever see; RSS descriptions are
+# attacker-influenced HTML and unbounded input is what makes lazy
+# quantifier patterns blow up on pathological strings
+_MAX_SCAN_CHARS = 4096
+
+# Upper bound on how much RSS we will download; a Goodreads feed is a few
+# hundred KB at most, so anything beyond this is truncated rather than
+# buffered in full
+_MAX_FEED_BYTES = 2 * 1024 * 1024
+
+# The challenge widget sits near the top of the profile page, so only a
+# prefix of the (often several-hundred-KB) document is worth downloading
+_MAX_PROFILE_BYTES = 128 * 1024
+
+# How many feed entries the book scan will ever look at; everything past
+# this is ignored so per-request work stays constant on huge feeds
+_MAX_ENTRIES_SCANNED = 20
+# Window (within the scan) considered for the "started reading" fallback
+_STARTED_WINDOW = 10
+
+# Shared pool for the outbound Goodreads requests, so the profile-page
+# fetch can overlap the RSS fetch instead of running after it
+_HTTP_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Separate pool for stale-while-revalidate refreshes. A refresh runs
+# fetch_goodreads_data, which itself submits to _HTTP_POOL and blocks on
+# the result; running refreshes on _HTTP_POOL too would let a handful of
+# them occupy every worker and starve the nested fetches they wait on.
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Shared HTTP session: keep-alive avoids a fresh TCP+TLS handshake to
+# goodreads.com on every cache miss, and advertising compression shrinks
+# the payload we have to parse
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    # Only codings urllib3 can decode with the pinned stack; advertising
+    # br without a brotli package would pass compressed bytes through
+    "Accept-Encoding": "gzip, deflate",
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+# Simple in-memory caching system, LRU-ordered and bounded so a long-
+# running process doesn't accumulate an entry per distinct RSS URL forever
+cache_storage = collections.OrderedDict()
+_MAX_CACHE_ENTRIES = 512
+_cache_lock = threading.Lock()
+_inflight = {}  # cache_key -> Event set when the fetching thread finishes
+
+def cache_with_timeout(timeout_minutes, stale_minutes=None):
     """
     A simple caching decorator that stores results in memory.
-    Helps reduce API calls and improve response times.
+    Thread-safe with single-flight semantics: on a cold or expired key,
+    only one request does the expensive fetch while concurrent requests
+    wait for its result instead of fetching in parallel.
+
+    Entries between timeout_minutes and timeout_minutes + stale_minutes
+    old are served immediately while a background refresh runs, so the
+    fetch latency never lands on a request that already has data to
+    show (stale-while-revalidate). stale_minutes defaults to
+    timeout_minutes.
     """
+    if stale_minutes is None:
+        stale_minutes = timeout_minutes
+    fresh_window = timedelta(minutes=timeout_minutes)
+    stale_window = timedelta(minutes=timeout_minutes + stale_minutes)
+
     def decorator(func):
+        def _fetch_and_store(cache_key, args, kwargs):
+            """Run func, cache its result, and release any waiters."""
+            try:
+                result = func(*args, **kwargs)
+                with _cache_lock:
+                    cache_storage[cache_key] = (result, datetime.now())
+                    cache_storage.move_to_end(cache_key)
+                    while len(cache_storage) > _MAX_CACHE_ENTRIES:
+                        cache_storage.popitem(last=False)
+                return result
+            finally:
+                with _cache_lock:
+                    done = _inflight.pop(cache_key, None)
+                if done is not None:
+                    done.set()
+
+        def _background_refresh(cache_key, args, kwargs):
+            try:
+                _fetch_and_store(cache_key, args, kwargs)
+            except Exception as e:
+                log.warning("Background refresh of %s failed: %s", func.__name__, e)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create a unique cache key
-            cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            
-            # Check if we have a valid cached result
-            if cache_key in cache_storage:
-                result, timestamp = cache_storage[cache_key]
-                if datetime.now() - timestamp < timedelta(minutes=timeout_minutes):
-                    print(f"Cache hit for {func.__name__}")
-                    return result
-            
+            # Fixed-length bytes key: hashes and compares in constant
+            # time on dict lookup, unlike the old long formatted string
+            h = hashlib.blake2b(digest_size=16)
+            h.update(func.__name__.encode())
+            h.update(repr(args).encode())
+            h.update(repr(sorted(kwargs.items())).encode())
+            cache_key = h.digest()
+
+            with _cache_lock:
+                entry = cache_storage.get(cache_key)
+                if entry is not None:
+                    result, timestamp = entry
+                    age = datetime.now() - timestamp
+                    if age >= stale_window:
+                        # Expired past any usefulness; evict eagerly
+                        del cache_storage[cache_key]
+                    elif age < fresh_window:
+                        cache_storage.move_to_end(cache_key)
+                        log.debug("Cache hit for %s", func.__name__)
+                        return result
+                    else:
+                        # Serve stale data now; refresh off the request path
+                        cache_storage.move_to_end(cache_key)
+                        if cache_key not in _inflight:
+                            _inflight[cache_key] = threading.Event()
+                            _REFRESH_POOL.submit(_background_refresh, cache_key, args, kwargs)
+                        log.debug("Serving stale %s while revalidating", func.__name__)
+                        return result
+                waiter = _inflight.get(cache_key)
+                if waiter is None:
+                    # We are the fetching thread
+                    _inflight[cache_key] = threading.Event()
+
+            if waiter is not None:
+                # Wait for the in-flight fetch, then reuse its result
+                waiter.wait(timeout=30)
+                with _cache_lock:
+                    if cache_key in cache_storage:
+                        result, timestamp = cache_storage[cache_key]
+                        if datetime.now() - timestamp < stale_window:
+                            log.debug("Cache hit for %s (after waiting)", func.__name__)
+                            return result
+                # The fetcher failed or timed out; fall through and try ourselves
+                with _cache_lock:
+                    if cache_key not in _inflight:
+                        _inflight[cache_key] = threading.Event()
+
             # Call the function and cache the result
-            print(f"Cache miss for {func.__name__}, fetching fresh data")
-            result = func(*args, **kwargs)
-            cache_storage[cache_key] = (result, datetime.now())
-            return result
+            log.debug("Cache miss for %s, fetching fresh data", func.__name__)
+            return _fetch_and_store(cache_key, args, kwargs)
         return wrapper
     return decorator
 
-def extract_author_from_entry(entry):
+def extract_author_from_entry(entry, title=None):
     """
     Extract author name from RSS entry using multiple strategies.
+    Accepts an optional pre-normalized title so callers that already
+    cleaned the whitespace don't pay for it again.
     Returns the most likely author name or 'Unknown Author' if not found.
     """
     try:
         # Strategy 1: Look for author links in the HTML description
-        if hasattr(entry, 'description'):
-            soup = BeautifulSoup(entry.description, 'html.parser')
-            author_link = soup.find('a', href=re.compile(r'/author/'))
+        desc = getattr(entry, 'description', None)
+        # Cheap substring gate: if neither marker appears, no strategy
+        # below can succeed, so fall straight through to the title
+        if desc and ('/author/' in desc or ' by ' in desc):
+            # Fast path: the anchor has a fixed enough shape that a raw
+            # regex usually finds it without building a soup tree
+            fast_match = _AUTHOR_A_RE.search(desc[:_MAX_SCAN_CHARS])
+            if fast_match:
+                author_name = fast_match.group(1).strip()
+                if len(author_name) > 1:
+                    return author_name
+
+            # Second fast path: "by Author" in the raw HTML text
+            by_match = _BY_TEXT_RE.search(desc[:_MAX_SCAN_CHARS])
+            if by_match:
+                author_name = by_match.group(1).strip()
+                if len(author_name) > 1:
+                    return author_name
+
+            # Only now pay for a DOM build
+            soup = BeautifulSoup(desc, 'lxml')
+            author_link = soup.find('a', href=_AUTHOR_HREF_RE)
             if author_link:
                 author_name = author_link.get_text().strip()
                 if author_name and len(author_name) > 1:
                     return author_name
-            
+
             # Strategy 2: Look for "by Author" pattern in description
-            desc_text = soup.get_text()
-            by_match = re.search(r' by ([^<\n]+?)(?:\s*<|$)', desc_text)
+            desc_text = soup.get_text()[:_MAX_SCAN_CHARS]
+            by_match = _BY_AUTHOR_RE.search(desc_text)
             if by_match:
                 author_name = by_match.group(1).strip()
                 if author_name and len(author_name) > 1:
                     return author_name
     except Exception as e:
-        print(f"Author extraction error: {e}")
+        log.debug("Author extraction error: %s", e)
     
     # Strategy 3: Parse from title
-    title = ' '.join(entry.title.split())
-    if " by " in title:
-        return title.split(" by ")[-1].split("(")[0].strip()
-    
+    if title is None:
+        title = ' '.join(entry.title.split())[:_MAX_SCAN_CHARS]
+    author_part = title.rpartition(" by ")[2]
+    if author_part != title:
+        return author_part.split("(")[0].strip()
+
     return "Unknown Author"
 
-def extract_progress_from_entry(entry):
+def extract_progress_from_entry(entry, title=None):
     """
     Extract reading progress percentage from RSS entry.
     Handles various formats like "25%" or "page 50 of 200".
+    Accepts an optional pre-normalized title to avoid recomputing it.
     """
-    title = ' '.join(entry.title.split())
-    
-    # Look for percentage
-    match = re.search(r'(\d+)%', title)
-    if match:
-        return min(int(match.group(1)), 100)
-    
-    # Look for page numbers
-    match = re.search(r'page (\d+) of (\d+)', title, re.IGNORECASE)
+    if title is None:
+        title = ' '.join(entry.title.split())[:_MAX_SCAN_CHARS]
+
+    # One pass picks up either "25%" or "page 50 of 200"
+    match = _PROGRESS_RE.search(title)
     if match:
-        current = int(match.group(1))
-        total = int(match.group(2))
+        if match.group('pct'):
+            return min(int(match.group('pct')), 100)
+        current = int(match.group('cur'))
+        total = int(match.group('total'))
         if total > 0:
             return min(int((current / total) * 100), 100)
-    
+
     return 0
 
+@lru_cache(maxsize=2048)
 def extract_user_id_from_rss(rss_url):
     """Extract Goodreads user ID from RSS URL."""
-    match = re.search(r'/user/updates_rss/(\d+)', rss_url)
+    match = _USER_ID_RE.search(rss_url)
     if match:
         return match.group(1)
     return None
 
-def fetch_challenge_stats(user_id):
+# Conditional-GET state per feed URL: (etag, last_modified, parsed feed).
+# A 304 from Goodreads lets us skip the download and the parse entirely.
+_feed_meta = collections.OrderedDict()
+_feed_meta_lock = threading.Lock()
+_MAX_FEED_META = 512
+
+def truncate_feed(body, max_items=_MAX_ENTRIES_SCANNED):
+    """
+    Cut the raw RSS bytes after max_items closing </item> tags. The
+    scan never looks past that window, so parsing the rest of a large
+    feed is pure waste; find() on bytes keeps this a cheap C-level scan.
+    """
+    pos = -1
+    for _ in range(max_items):
+        pos = body.find(b'</item>', pos + 1)
+        if pos == -1:
+            return body
+    return body[:pos + len(b'</item>')] + b'</channel></rss>'
+
+def fetch_feed(rss_url):
+    """
+    Download the RSS feed over the shared session and hand the bytes to
+    feedparser. Doing the fetch ourselves reuses the pooled connection
+    and lets us cap how much we buffer, instead of feedparser opening
+    its own urllib connection and reading the body unbounded.
+
+    Sends If-None-Match/If-Modified-Since from the previous response;
+    on a 304 the previously parsed feed is returned with no download or
+    parse at all.
+    """
+    headers = {}
+    with _feed_meta_lock:
+        meta = _feed_meta.get(rss_url)
+    if meta:
+        etag, last_modified, _ = meta
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = _SESSION.get(rss_url, timeout=10, stream=True, headers=headers)
+    if response.status_code == 304 and meta:
+        response.close()
+        log.debug("Feed unchanged (304) for %s", rss_url)
+        return meta[2]
+    try:
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _MAX_FEED_BYTES:
+                break
+    finally:
+        response.close()
+    # Skip feedparser's HTML sanitization and relative-URI resolution
+    # passes; we only read titles/descriptions through our own bounded
+    # extractors, so that per-entry post-processing is wasted work
+    feed = feedparser.parse(
+        truncate_feed(b''.join(chunks)),
+        resolve_relative_uris=False,
+        sanitize_html=False,
+    )
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        with _feed_meta_lock:
+            _feed_meta[rss_url] = (etag, last_modified, feed)
+            _feed_meta.move_to_end(rss_url)
+            while len(_feed_meta) > _MAX_FEED_META:
+                _feed_meta.popitem(last=False)
+    return feed
+
+def scan_feed_for_challenge(feed):
+    """
+    Look for challenge progress in an already-parsed RSS feed.
+    Challenge updates often appear there, which lets us skip the
+    profile-page scrape entirely.
+    Returns (books_read, books_goal) or None.
+    """
+    if feed is None:
+        return None
+    for entry in islice(feed.entries, _MAX_ENTRIES_SCANNED):
+        for text in (entry.title, getattr(entry, 'description', '')):
+            match = _CHALLENGE_LINK_RE.search(text[:_MAX_SCAN_CHARS])
+            if match:
+                return _challenge_counts(match)
+    return None
+
+def fetch_challenge_from_profile(user_id):
     """
-    Fetch reading challenge statistics from Goodreads profile page.
-    Returns formatted string like "15 of 25 books" or None if not found.
+    Scrape challenge statistics from the Goodreads profile page.
+    Returns (books_read, books_goal) or None.
     """
     if not user_id:
         return None
-    
+
     try:
         profile_url = f"https://www.goodreads.com/user/show/{user_id}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
-        
-        response = requests.get(profile_url, headers=headers, timeout=10)
-        
+        response = _SESSION.get(profile_url, timeout=10, stream=True)
+
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for the challenge progress link
-            challenge_link = soup.find('a', class_='challengeBooksRead')
-            if challenge_link:
-                challenge_text = challenge_link.get_text()
-                # Extract "X books of your goal of Y" pattern
-                patterns = [
-                    r'read (\d+) books? of your goal of (\d+)',
-                    r'read (\d+) of (\d+) books',
-                    r'(\d+) books? of (?:your goal of )?(\d+)'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, challenge_text, re.IGNORECASE)
-                    if match:
-                        books_read = int(match.group(1))
-                        books_goal = int(match.group(2))
-                        return f"{books_read} of {books_goal} books"
-            
-            # Alternative: Look in the year challenge module
+            # Read only a bounded, decompressed prefix of the page
+            try:
+                body = response.raw.read(_MAX_PROFILE_BYTES, decode_content=True)
+            finally:
+                response.close()
+
+            # Cheap gate before the pattern battery: if the page never
+            # mentions a challenge, no pattern below can meaningfully
+            # match, so skip decoding and scanning entirely
+            if b'challenge' not in body and b'Challenge' not in body:
+                log.debug("No challenge widget on profile page for user %s", user_id)
+                return None
+
+            page_text = body.decode(response.encoding or 'utf-8', errors='replace')
+
+            # The "read N of M" phrasing is distinctive enough to match on
+            # the raw HTML directly, skipping the DOM build for a page
+            # that can run to hundreds of KB
+            match = _CHALLENGE_LINK_RE.search(page_text)
+            if match:
+                return _challenge_counts(match)
+
+            # Alternative: Look in the year challenge modules; slice a
+            # small window after each widget marker and match inside it
             current_year = datetime.now().year
-            challenge_modules = soup.find_all('div', id=re.compile(r'user_challenge_\d+'))
-            
-            for module in challenge_modules:
-                module_text = module.get_text()
-                if str(current_year) in module_text:
+            for id_match in _CHALLENGE_MODULE_ID_RE.finditer(page_text):
+                window = page_text[id_match.start():id_match.start() + 2048]
+                if str(current_year) in window:
                     # Try various patterns
-                    patterns = [
-                        r'read (\d+) books? of your goal of (\d+)',
-                        r'(\d+) of (\d+) books',
-                        r'(\d+) books? .*?goal.*?(\d+)'
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, module_text, re.IGNORECASE)
+                    for pattern in _challenge_patterns_for_year(current_year):
+                        match = pattern.search(window)
                         if match:
-                            return f"{match.group(1)} of {match.group(2)} books"
-            
-            print(f"Challenge data not found on profile page for user {user_id}")
-            
+                            return (int(match.group(1)), int(match.group(2)))
+
+            log.debug("Challenge data not found on profile page for user %s", user_id)
+        else:
+            response.close()
+
     except Exception as e:
-        print(f"Error fetching challenge data: {e}")
+        log.warning("Error fetching challenge data: %s", e)
     
     return None
 
@@ -171,93 +487,151 @@ def fetch_goodreads_data(rss_url):
     Returns book information and reading challenge progress.
     """
     try:
-        # Parse RSS feed
-        feed = feedparser.parse(rss_url)
+        # The user ID comes from the URL alone, so the profile-page fetch
+        # can start before the feed is even downloaded
+        user_id = extract_user_id_from_rss(rss_url)
+        challenge_future = None
+        if user_id:
+            challenge_future = _HTTP_POOL.submit(fetch_challenge_from_profile, user_id)
+
+        # Fetch and parse RSS feed
+        feed = fetch_feed(rss_url)
         if not feed.entries:
-            print("No entries found in RSS feed")
+            log.info("No entries found in RSS feed")
+            if challenge_future:
+                challenge_future.cancel()
             return None
         
-        # Extract user ID for challenge data
-        user_id = extract_user_id_from_rss(rss_url)
-        
-        # Look for current book with progress
-        current_book = None
-        
-        # Check first 20 entries for reading activity
-        for entry in feed.entries[:20]:
-            title = ' '.join(entry.title.split())
+        # Look for current book with progress; also remember the most
+        # recent "started reading" entry as a fallback so the feed is
+        # walked exactly once instead of two overlapping passes.
+        # Plain locals instead of a dict holding the feedparser entry:
+        # the entry (with its raw description HTML) is released as soon
+        # as the loop ends instead of being retained in a container.
+        book_title = book_author = None
+        book_progress = 0
+        book_published = None
+        started_candidate = None
+
+        # Bind the compiled-pattern methods once; inside the loop each
+        # use is then a plain local load instead of two global/attribute
+        # lookups per iteration
+        phrases_search = _PROGRESS_PHRASES_RE.search
+        quoted_search = _QUOTED_RE.search
+        done_search = _DONE_WITH_RE.search
+
+        # Check the newest entries for reading activity
+        for i, entry in enumerate(islice(feed.entries, _MAX_ENTRIES_SCANNED)):
+            # Normalize whitespace once per entry; the extractors reuse it
+            title = ' '.join(entry.title.split())[:_MAX_SCAN_CHARS]
             title_lower = title.lower()
-            
+
             # Check for reading progress indicators
-            if any(phrase in title_lower for phrase in ["currently reading", "is on page", "% done", "progress", "done with"]):
+            if phrases_search(title_lower):
                 # Extract book title
-                book_match = re.search(r"'([^']+)'", title)
+                book_match = quoted_search(title)
                 if not book_match:
                     # Try alternative pattern
-                    book_match = re.search(r"done with (.+?)$", title)
-                
+                    book_match = done_search(title)
+
                 if book_match:
-                    current_book = {
-                        "title": book_match.group(1).strip(),
-                        "author": extract_author_from_entry(entry),
-                        "progress": extract_progress_from_entry(entry),
-                        "entry": entry
-                    }
+                    book_title = book_match.group(1).strip()
+                    book_author = extract_author_from_entry(entry, title=title)
+                    book_progress = extract_progress_from_entry(entry, title=title)
+                    book_published = getattr(entry, 'published', None)
                     break
-        
-        # If no current book with progress, find most recent "started reading"
-        if not current_book:
-            for entry in feed.entries[:10]:
-                title = ' '.join(entry.title.split())
-                if "started reading" in title.lower():
-                    book_match = re.search(r"'([^']+)'", title)
-                    if book_match:
-                        current_book = {
-                            "title": book_match.group(1),
-                            "author": extract_author_from_entry(entry),
-                            "progress": 0,
-                            "entry": entry
-                        }
-                        break
-        
-        if not current_book:
-            print("No current book found in RSS feed")
+
+            # Fallback candidate: most recent "started reading" in the
+            # first few entries (same window the old second pass covered)
+            if started_candidate is None and i < _STARTED_WINDOW and "started reading" in title_lower:
+                book_match = quoted_search(title)
+                if book_match:
+                    # Author extraction is deferred until we know this
+                    # candidate is actually used
+                    started_candidate = (book_match.group(1), title, entry)
+
+        # If no current book with progress, use the "started reading" entry
+        if book_title is None and started_candidate:
+            book_title, title, entry = started_candidate
+            book_author = extract_author_from_entry(entry, title=title)
+            book_progress = 0
+            book_published = getattr(entry, 'published', None)
+
+        if book_title is None:
+            log.info("No current book found in RSS feed")
+            if challenge_future:
+                challenge_future.cancel()
             return None
-        
+
         # Extract dates
-        start_date = current_book["entry"].published if hasattr(current_book["entry"], 'published') else None
-        
-        # Fetch reading challenge data
-        challenge = fetch_challenge_stats(user_id)
+        # Format once here so cache hits serve the pre-rendered string
+        # instead of re-running strptime on every poll
+        start_date = format_date(book_published)
         
+        # Prefer challenge data from the feed itself; otherwise collect the
+        # profile-page fetch that has been running in the background
+        challenge = scan_feed_for_challenge(feed)
+        if not challenge and challenge_future:
+            try:
+                challenge = challenge_future.result(timeout=15)
+            except Exception as e:
+                log.warning("Challenge fetch failed: %s", e)
+
+        # Render the challenge string and percentage once at cache time
+        challenge_str = None
+        challenge_percent = 0
+        if challenge:
+            books_read, books_goal = challenge
+            challenge_str = f"{books_read} of {books_goal} books"
+            if books_goal > 0:
+                challenge_percent = min(books_read * 100 // books_goal, 100)
+
         return {
-            "title": current_book["title"],
-            "author": current_book["author"],
-            "progress": current_book["progress"],
+            "title": book_title,
+            "author": book_author,
+            "progress": book_progress,
             "start_date": start_date,
-            "challenge": challenge
+            "challenge": challenge_str,
+            "challenge_progress_percent": challenge_percent
         }
         
     except Exception as e:
-        print(f"Error fetching RSS data: {e}")
+        log.warning("Error fetching RSS data: %s", e)
         return None
 
+@lru_cache(maxsize=4)
+def _current_time_for_bucket(minute_bucket):
+    return datetime.now().strftime('%m/%d %H:%M')
+
+def current_time_str():
+    """The 'current_time' display string, formatted at most once per
+    wallclock minute regardless of request rate (strftime is slow)."""
+    return _current_time_for_bucket(int(time.time()) // 60)
+
+@lru_cache(maxsize=256)
 def format_date(dt):
-    """Format date for display in a user-friendly way."""
+    """
+    Format date for display in a user-friendly way.
+    Memoized: the same RSS date string recurs on every refresh of the
+    same book, and strptime is expensive enough to be worth skipping.
+    """
     if not dt:
         return "Unknown"
     try:
         if isinstance(dt, str):
-            parsed_date = datetime.strptime(dt, "%a, %d %b %Y %H:%M:%S %z")
-            return parsed_date.strftime("%b %d, %Y")
+            # RSS dates are RFC 822; parsedate_to_datetime is much
+            # cheaper than strptime's format-string machinery
+            dt = parsedate_to_datetime(dt)
         return dt.strftime("%b %d, %Y")
-    except:
+    except (TypeError, ValueError):
         return "Unknown"
 
-def generate_demo_data():
-    """Generate sample data for demonstration purposes."""
+@lru_cache(maxsize=2)
+def _demo_data_for_day(today):
+    """Build the day's demo payload; seeded by date, so it only needs
+    computing once per day."""
     import random
-    
+
     demo_books = [
         {"title": "The Midnight Library", "author": "Matt Haig"},
         {"title": "Project Hail Mary", "author": "Andy Weir"},
@@ -265,22 +639,21 @@ def generate_demo_data():
         {"title": "The Seven Husbands of Evelyn Hugo", "author": "Taylor Jenkins Reid"},
         {"title": "Atomic Habits", "author": "James Clear"}
     ]
-    
+
     # Use current time as seed for consistent daily data
-    today = datetime.now().date()
     random.seed(str(today))
-    
+
     book = random.choice(demo_books)
     progress = random.randint(15, 85)
-    
+
     # Generate dates
     days_ago = random.randint(3, 14)
     start_date = datetime.now() - timedelta(days=days_ago)
-    
+
     # Generate challenge data
     current_books = random.randint(15, 45)
     goal_books = random.randint(50, 100)
-    
+
     return {
         "title": book["title"],
         "author": book["author"],
@@ -289,16 +662,18 @@ def generate_demo_data():
         "update_date": start_date.strftime("%b %d, %Y"),
         "challenge": f"{current_books} of {goal_books} books",
         "challenge_progress_percent": int((current_books / goal_books) * 100),
-        "current_time": datetime.now().strftime('%m/%d %H:%M'),
         "is_demo": True
     }
 
-# Routes
+def generate_demo_data():
+    """Generate sample data for demonstration purposes."""
+    # Only current_time varies within a day; the rest is cached
+    data = dict(_demo_data_for_day(datetime.now().date()))
+    data["current_time"] = current_time_str()
+    return data
 
-@app.route("/")
-def home():
-    """Home page with information about the TRMNL Goodreads Recipe."""
-    return """
+# Rendered once at import time; home() has no dynamic content.
+_HOME_PAGE = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -349,6 +724,13 @@ def home():
     </html>
     """
 
+# Routes
+
+@app.route("/")
+def home():
+    """Home page with information about the TRMNL Goodreads Recipe."""
+    return _HOME_PAGE
+
 @app.route("/trmnl-data")
 def serve_trmnl_data():
     """
@@ -357,7 +739,7 @@ def serve_trmnl_data():
     """
     # Check if demo mode is requested
     if request.args.get('demo') == 'true':
-        return jsonify(generate_demo_data())
+        return etag_json_response(generate_demo_data())
     
     # Get RSS URL from query parameter
     rss_url = request.args.get('rss_url', '').strip()
@@ -367,14 +749,14 @@ def serve_trmnl_data():
         # Return demo data if no valid URL provided
         demo_data = generate_demo_data()
         demo_data["error"] = "Please provide a valid Goodreads RSS URL"
-        return jsonify(demo_data)
+        return etag_json_response(demo_data)
     
     # Fetch book data (with caching)
     book_data = fetch_goodreads_data(rss_url)
     
     if not book_data:
         # Return graceful fallback
-        return jsonify({
+        return etag_json_response({
             "title": "No current book found",
             "author": "Start reading on Goodreads",
             "progress": 0,
@@ -382,39 +764,28 @@ def serve_trmnl_data():
             "update_date": "Unknown", 
             "challenge": None,
             "challenge_progress_percent": 0,
-            "current_time": datetime.now().strftime('%m/%d %H:%M')
+            "current_time": current_time_str()
         })
     
-    # Calculate challenge progress percentage
-    challenge_progress_percent = 0
-    if book_data.get('challenge'):
-        try:
-            parts = book_data['challenge'].split(' of ')
-            if len(parts) == 2:
-                current = int(parts[0])
-                total = int(parts[1].split(' ')[0])
-                challenge_progress_percent = min(int((current / total) * 100), 100)
-        except:
-            pass
-    
-    # Format response for TRMNL
+    # Format response for TRMNL; challenge fields were computed at cache
+    # time, so no string re-parsing happens here
     response = {
         "title": book_data.get('title', 'Unknown Title'),
         "author": book_data.get('author', 'Unknown Author'),
         "progress": book_data.get('progress', 0),
-        "start_date": format_date(book_data.get('start_date')),
-        "update_date": format_date(book_data.get('start_date')),
+        "start_date": book_data.get('start_date', 'Unknown'),
+        "update_date": book_data.get('start_date', 'Unknown'),
         "challenge": book_data.get('challenge'),
-        "challenge_progress_percent": challenge_progress_percent,
-        "current_time": datetime.now().strftime('%m/%d %H:%M')
+        "challenge_progress_percent": book_data.get('challenge_progress_percent', 0),
+        "current_time": current_time_str()
     }
     
-    return jsonify(response)
+    return etag_json_response(response)
 
 @app.route("/health")
 def health():
     """Health check endpoint for monitoring."""
-    return jsonify({
+    return json_response({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "cache_size": len(cache_storage)
@@ -422,13 +793,27 @@ def health():
 
 @app.route("/clear-cache")
 def clear_cache():
-    """Clear all cached data - useful for forcing fresh data fetch."""
-    cache_storage.clear()
-    return jsonify({
+    """
+    Clear all cached data - useful for forcing fresh data fetch.
+    When ADMIN_TOKEN is set in the environment, the matching
+    X-Admin-Token header is required, so a stray scraper or health check
+    can't force repeated Goodreads re-fetches by invalidating the cache.
+    """
+    admin_token = os.environ.get('ADMIN_TOKEN')
+    if admin_token and request.headers.get('X-Admin-Token') != admin_token:
+        return Response(status=403)
+    with _cache_lock:
+        cache_storage.clear()
+    return json_response({
         "status": "cache cleared",
         "timestamp": datetime.now().isoformat()
     })
 
+# Production runs under gunicorn (see Procfile):
+#   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:$PORT app:app
+# The block below is only the local development entry point; Werkzeug's
+# dev server handles one request at a time, so a slow Goodreads fetch
+# would serialize every other client.
 if __name__ == "__main__":
     print("🚀 Starting TRMNL Goodreads Recipe Server")
     print("📚 Visit http://localhost:5001 to see the home page")